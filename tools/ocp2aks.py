@@ -15,19 +15,52 @@ Usage (CLI example):
       --ingress-class nginx \
       --tls-secret myapp-tls \
       --image-registry myacr.azurecr.io \
-      --repo-prefix apps
+      --repo-prefix apps \
+      --verbose
 
 All options also read from environment variables:
   SRC_DIR, OUT_DIR, DEFAULT_DOMAIN, INGRESS_CLASS, TLS_SECRET,
-  IMAGE_REGISTRY, REPO_PREFIX, REGISTRY_FALLBACK
+  IMAGE_REGISTRY, REPO_PREFIX, REGISTRY_FALLBACK, VERBOSE
+
+Requires PyYAML. If PyYAML was built against libyaml (the system `libyaml`
+package, e.g. libyaml-dev / libyaml-devel), the C loader/dumper is used for
+much faster parsing and emitting; otherwise it falls back to pure Python.
+
+A file is copied byte-for-byte, keeping its formatting and comments, when every
+document in it is a pass-through resource (a mapping with a 'kind' that is not
+converted) whose metadata.annotations, if present, is a non-empty mapping with
+no openshift.io/* keys. All other files are loaded and re-emitted by PyYAML and
+come out normalized (comments dropped).
 """
 
 import argparse
+import functools
+import io
+import logging
 import os
 import pathlib
+import shutil
+from concurrent.futures import ProcessPoolExecutor
 from copy import deepcopy
+from dataclasses import dataclass
+from itertools import repeat
 import yaml
 
+try:
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
+
+
+log = logging.getLogger(__name__)
+
+
+class NoAliasDumper(_Dumper):
+    """Dumper that never emits anchors/aliases; shared objects are written out in full."""
+
+    def ignore_aliases(self, data):
+        return True
+
 
 # ----------------------------
 # CLI / Environment parameters
@@ -55,14 +88,180 @@ def parse_args():
     p.add_argument("--repo-prefix", dest="repo_prefix",
                    default=os.getenv("REPO_PREFIX", ""),
                    help="Optional repository prefix in target registry (e.g., apps)")
+    p.add_argument("--verbose", dest="verbose", action="store_true",
+                   default=os.getenv("VERBOSE", "").lower() in ("1", "true", "yes"),
+                   help="Log each output file written (debug logging)")
     return p.parse_args()
 
 
+@dataclass(frozen=True, slots=True)
+class Config:
+    """Conversion settings derived from the CLI; hashable and cheap to pickle to workers."""
+    image_registry: str
+    repo_prefix: str
+    default_domain: str
+    ingress_class: str
+    tls_secret: str
+
+    @classmethod
+    def from_args(cls, args) -> "Config":
+        return cls(
+            image_registry=args.image_registry,
+            repo_prefix=args.repo_prefix,
+            default_domain=args.default_domain,
+            ingress_class=args.ingress_class,
+            tls_secret=args.tls_secret,
+        )
+
+
 # ----------------------------
 # Helpers
 # ----------------------------
-def is_yaml_file(p: pathlib.Path) -> bool:
-    return p.suffix.lower() in (".yml", ".yaml")
+_YAML_SUFFIXES = (".yml", ".yaml")
+_OCP_PREFIX = "openshift.io/"
+
+# OpenShift file name patterns / resource kinds → AKS output file names
+_FILENAME_PATTERNS = (("deploymentconfig", "deployment.yaml"), ("route", "ingress.yaml"))
+_KIND_TO_NAME = {"DeploymentConfig": "deployment.yaml", "Route": "ingress.yaml"}
+
+# Kinds that are converted or skipped rather than passed through
+_OCP_KINDS = frozenset({"DeploymentConfig", "Route", "BuildConfig"})
+
+
+def _scan_yaml(root: str):
+    """
+    Recursively yield os.DirEntry objects for YAML files under root.
+
+    os.scandir() caches file type info from the directory read, so this avoids
+    the extra stat() calls that Path.rglob() + is_file() would issue per entry.
+    Files in a directory are yielded before descending into its subdirectories,
+    matching rglob's order (which decides the winner when several sources map
+    to the same output name). Symlinked directories are not descended into
+    (same as rglob); missing or unreadable directories are skipped.
+    """
+    subdirs = []
+    try:
+        with os.scandir(root) as it:
+            for e in it:
+                if e.is_dir(follow_symlinks=False):
+                    subdirs.append(e.path)
+                elif e.is_file() and e.name.lower().endswith(_YAML_SUFFIXES):
+                    yield e
+    except OSError:
+        return
+    for d in subdirs:
+        yield from _scan_yaml(d)
+
+
+def _strip_ocp(anns: dict) -> dict:
+    """Drop OpenShift-only (openshift.io/*) annotations; returns anns itself when none are present."""
+    if not anns:
+        return {}
+    if not any(k.startswith(_OCP_PREFIX) for k in anns):
+        return anns
+    return {k: v for k, v in anns.items() if not k.startswith(_OCP_PREFIX)}
+
+
+# First characters of plain scalars the resolver may treat as int/float/timestamp
+_NUMERIC_START = frozenset("0123456789+-.")
+
+
+class _Frame:
+    """Open collection while walking parser events in _passthrough_count()."""
+    __slots__ = ("is_map", "expect_key", "key", "role", "size")
+
+    def __init__(self, is_map: bool, role):
+        self.is_map = is_map
+        self.expect_key = is_map
+        self.key = None
+        self.role = role  # "root", "metadata", "annotations" or None
+        self.size = 0
+
+
+def _passthrough_count(data: bytes):
+    """
+    Return the number of documents if the file would be written back unchanged, else None.
+
+    That holds when every document is a mapping with a top-level 'kind' that is
+    not converted or skipped, and its metadata.annotations (if present) is a
+    non-empty mapping with no openshift.io/* keys. Works on parser events only,
+    so no Python objects are constructed. Syntax errors raise as they would in
+    load_all(). Anything the safe loader might still reject or resolve
+    differently returns None instead, so the file is loaded normally:
+    - aliases, merge keys and complex keys;
+    - explicitly tagged nodes (e.g. '!custom', '!!python/object');
+    - plain scalars shaped like dates or numbers with '_', which can fail to
+      construct (e.g. 2001-02-30, 0x_).
+    """
+    n = 0
+    stack = []
+    at_root = has_kind = False
+    for ev in yaml.parse(data, Loader=_Loader):
+        if isinstance(ev, yaml.AliasEvent):
+            return None
+        if isinstance(ev, yaml.DocumentStartEvent):
+            at_root = True
+            has_kind = False
+            continue
+        if isinstance(ev, yaml.DocumentEndEvent):
+            if not has_kind:
+                return None
+            n += 1
+            continue
+        if isinstance(ev, (yaml.MappingEndEvent, yaml.SequenceEndEvent)):
+            frame = stack.pop()
+            if frame.role == "annotations" and not frame.size:
+                return None
+            continue
+        if not isinstance(ev, yaml.NodeEvent):
+            continue
+        if ev.tag is not None:
+            return None
+        if isinstance(ev, yaml.ScalarEvent) and ev.implicit[0]:
+            v = ev.value
+            if v[:1] in _NUMERIC_START and ("_" in v or v.count("-") >= 2):
+                return None
+
+        if at_root:
+            at_root = False
+            if not isinstance(ev, yaml.MappingStartEvent):
+                return None
+            stack.append(_Frame(True, "root"))
+            continue
+
+        parent = stack[-1]
+        role = None
+        if parent.is_map:
+            if parent.expect_key:
+                if not isinstance(ev, yaml.ScalarEvent) or ev.value == "<<":
+                    return None
+                parent.expect_key = False
+                parent.key = ev.value
+                parent.size += 1
+                if parent.role == "root" and ev.value == "kind":
+                    has_kind = True
+                elif parent.role == "annotations" and ev.value.startswith(_OCP_PREFIX):
+                    return None
+                continue
+
+            parent.expect_key = True
+            if parent.role == "root":
+                if parent.key == "kind":
+                    if isinstance(ev, yaml.ScalarEvent) and ev.value in _OCP_KINDS:
+                        return None
+                elif parent.key == "metadata":
+                    role = "metadata"
+            elif parent.role == "metadata" and parent.key == "annotations":
+                # null, scalar or sequence annotations are dropped/rewritten on load
+                if not isinstance(ev, yaml.MappingStartEvent):
+                    return None
+                role = "annotations"
+
+        if isinstance(ev, yaml.MappingStartEvent):
+            stack.append(_Frame(True, role))
+        elif isinstance(ev, yaml.SequenceStartEvent):
+            stack.append(_Frame(False, None))
+    return n
 
 
 def norm_labels(meta: dict) -> dict:
@@ -72,6 +271,7 @@ def norm_labels(meta: dict) -> dict:
     return meta
 
 
+@functools.lru_cache(maxsize=1024)
 def map_image(image: str, name_hint: str, image_registry: str, repo_prefix: str) -> str:
     """
     Map OpenShift ImageStream-like references to an ACR (or target registry) reference if requested.
@@ -82,6 +282,8 @@ def map_image(image: str, name_hint: str, image_registry: str, repo_prefix: str)
     - If empty or imagestream-ish, map to:
          IMAGE_REGISTRY[/REPO_PREFIX]/<name_hint>:latest
       (Tag pinning is expected in CD; ':latest' is a safe placeholder here.)
+
+    Pure function of its (string) arguments, so results are memoized.
     """
     image = image or ""
     # Simple heuristic to detect fully-qualified references
@@ -104,23 +306,22 @@ def map_image(image: str, name_hint: str, image_registry: str, repo_prefix: str)
 # ----------------------------
 # Converters
 # ----------------------------
-def to_deployment(dc: dict, image_registry: str, repo_prefix: str) -> dict:
+def to_deployment(dc: dict, cfg: Config) -> dict:
     """Convert OpenShift DeploymentConfig → Kubernetes Deployment (apps/v1)."""
-    meta = deepcopy(dc.get("metadata", {}))
-    spec = deepcopy(dc.get("spec", {}))
+    # The source DC is discarded after conversion, so its metadata/spec are
+    # reused in place rather than deep-copied.
+    meta = dc.get("metadata") or {}
+    spec = dc.get("spec") or {}
     name = meta.get("name", "app")
     meta = norm_labels(meta)
 
     template = spec.get("template", {}) or {}
     tpl_meta = norm_labels(template.get("metadata", {}) or {})
     tpl_spec = template.get("spec", {}) or {}
-    
-    # Get labels and deep copy to avoid YAML anchors
-    labels = deepcopy(tpl_meta.get("labels") or meta.get("labels") or {"app": name})
-    selector_labels = deepcopy(labels)
-    template_labels = deepcopy(labels)
-    
-    print(f"template meta 111: {labels} ")
+
+    # The same labels dict is shared below; NoAliasDumper keeps it from
+    # being written as YAML anchors/aliases
+    labels = tpl_meta.get("labels") or meta.get("labels") or {"app": name}
 
     deployment = {
         "apiVersion": "apps/v1",
@@ -128,21 +329,15 @@ def to_deployment(dc: dict, image_registry: str, repo_prefix: str) -> dict:
         "metadata": {
             "name": name,
             "labels": labels,
-            "annotations": {
-                k: v for k, v in (meta.get("annotations") or {}).items()
-                if not k.startswith("openshift.io/")
-            },
+            "annotations": _strip_ocp(meta.get("annotations")),
         },
         "spec": {
             "replicas": spec.get("replicas", 1),
-            "selector": {"matchLabels": selector_labels},
+            "selector": {"matchLabels": labels},
             "template": {
                 "metadata": {
-                    "labels": template_labels,
-                    "annotations": {
-                        k: v for k, v in (tpl_meta.get("annotations") or {}).items()
-                        if not k.startswith("openshift.io/")
-                    },
+                    "labels": labels,
+                    "annotations": _strip_ocp(tpl_meta.get("annotations")),
                 },
                 "spec": tpl_spec,
             },
@@ -176,8 +371,8 @@ def to_deployment(dc: dict, image_registry: str, repo_prefix: str) -> dict:
         c["image"] = map_image(
             img,
             name_hint=c.get("name", name),
-            image_registry=image_registry,
-            repo_prefix=repo_prefix,
+            image_registry=cfg.image_registry,
+            repo_prefix=cfg.repo_prefix,
         )
         if not c.get("imagePullPolicy"):
             c["imagePullPolicy"] = "IfNotPresent"
@@ -185,13 +380,13 @@ def to_deployment(dc: dict, image_registry: str, repo_prefix: str) -> dict:
     return deployment
 
 
-def to_ingress(route: dict, default_domain: str, ingress_class: str, tls_secret: str) -> dict:
+def to_ingress(route: dict, cfg: Config) -> dict:
     """Convert OpenShift Route → Kubernetes Ingress (networking.k8s.io/v1)."""
     meta = deepcopy(route.get("metadata", {}))
     spec = deepcopy(route.get("spec", {}) or {})
     name = meta.get("name", "web")
 
-    host = spec.get("host") or f"{name}.{default_domain}"
+    host = spec.get("host") or f"{name}.{cfg.default_domain}"
     to_ref = (spec.get("to") or {})
     svc_name = to_ref.get("name") or name
     target_port = ((spec.get("port") or {}).get("targetPort")) or 80  # can be int or str
@@ -204,7 +399,7 @@ def to_ingress(route: dict, default_domain: str, ingress_class: str, tls_secret:
             "labels": {k: v for k, v in (meta.get("labels") or {}).items()},
             # If you prefer spec.ingressClassName, you can move this to spec.ingressClassName below
             "annotations": {
-                "kubernetes.io/ingress.class": ingress_class
+                "kubernetes.io/ingress.class": cfg.ingress_class
             },
         },
         "spec": {
@@ -231,8 +426,8 @@ def to_ingress(route: dict, default_domain: str, ingress_class: str, tls_secret:
 
     # TLS: prefer explicit input, else assume a same-named secret if Route had TLS
     tls_entries = []
-    if tls_secret:
-        tls_entries.append({"hosts": [host], "secretName": tls_secret})
+    if cfg.tls_secret:
+        tls_entries.append({"hosts": [host], "secretName": cfg.tls_secret})
     elif spec.get("tls"):
         tls_entries.append({"hosts": [host], "secretName": f"{name}-tls"})
 
@@ -245,27 +440,99 @@ def to_ingress(route: dict, default_domain: str, ingress_class: str, tls_secret:
 # ----------------------------
 # File naming helper
 # ----------------------------
-def map_output_filename(source_path, out_docs):
-    """Map OpenShift filenames to AKS equivalents based on converted resource kinds."""
-    name = source_path.name
-    
-    # Collect kinds in the output documents
-    kinds_in_output = {doc.get("kind") for doc in out_docs if isinstance(doc, dict)}
-    
-    # Map OpenShift resource names to AKS equivalents
-    mappings = {
-        ("DeploymentConfig", "deploymentconfig"): "deployment.yaml",
-        ("Route", "route"): "ingress.yaml",
-    }
-    
-    # Check if file name or kinds match, apply mapping
+def map_output_filename(source_path: str, out_docs) -> str:
+    """Map OpenShift filenames to AKS equivalents based on converted resource kinds; returns a file name."""
+    name = os.path.basename(source_path)
+
+    # File name match first: plain substring checks, no per-file set/dict building
     name_lower = name.lower()
-    for (kind, pattern), new_name in mappings.items():
-        if pattern in name_lower or kind in kinds_in_output:
-            return source_path.with_name(new_name)
-    
+    for pattern, new_name in _FILENAME_PATTERNS:
+        if pattern in name_lower:
+            return new_name
+
+    # Fall back to the kinds present in the output documents
+    kinds_in_output = {doc.get("kind") for doc in out_docs if isinstance(doc, dict)}
+    for kind, new_name in _KIND_TO_NAME.items():
+        if kind in kinds_in_output:
+            return new_name
+
     # Default: keep original name
-    return source_path
+    return name
+
+
+# ----------------------------
+# Per-file transform
+# ----------------------------
+def _summary(dc_n: int, route_n: int, bc_n: int, other_n: int) -> dict:
+    return {"DeploymentConfig": dc_n, "Route": route_n, "BuildConfig": bc_n, "Other": other_n}
+
+
+def process_file(path_str: str, cfg: Config):
+    """
+    Parse and convert a single source file.
+
+    Returns (out_docs, summary_delta, warnings, verbatim). When verbatim is True
+    _passthrough_count() found nothing to change and the file should be copied
+    as-is; out_docs is then empty. Runs in a worker process, so it only takes and returns
+    picklable values and does no output writing itself.
+    """
+    # Plain local counters in the per-document loop; the summary dict is only
+    # assembled on return
+    dc_n = route_n = bc_n = other_n = 0
+    warnings = []
+
+    try:
+        with open(path_str, "rb") as f:
+            data = f.read()
+
+        # Nothing to convert or strip: confirmed from parser events alone, so
+        # let the caller copy the bytes and skip load + dump entirely. The scan
+        # stops at the first document it can't vouch for (usually at 'kind'),
+        # and such files go through load_all() below.
+        count = _passthrough_count(data)
+        if count:
+            return [], _summary(dc_n, route_n, bc_n, count), warnings, True
+
+        # libyaml decodes the bytes itself; no intermediate str copy
+        docs = list(yaml.load_all(data, Loader=_Loader))
+    except Exception as e:
+        warnings.append(f"Failed to parse {path_str}: {e}")
+        return [], _summary(dc_n, route_n, bc_n, other_n), warnings, False
+
+    out_docs = []
+    for doc in docs:
+        if not isinstance(doc, dict) or "kind" not in doc:
+            continue
+
+        kind = doc.get("kind")
+        if kind == "DeploymentConfig":
+            dc_n += 1
+            out_docs.append(to_deployment(doc, cfg))
+
+        elif kind == "Route":
+            route_n += 1
+            out_docs.append(to_ingress(doc, cfg))
+
+        elif kind == "BuildConfig":
+            bc_n += 1
+            warnings.append(
+                f"BuildConfig '{doc.get('metadata', {}).get('name', 'unnamed')}' skipped: "
+                f"move builds to CI (e.g., GitHub Actions) and push images to "
+                f"{cfg.image_registry or 'ACR'}."
+            )
+
+        else:
+            # Pass-through for k8s-native resources; remove OpenShift-only annotations
+            other_n += 1
+            if isinstance(doc.get("metadata"), dict):
+                anns = _strip_ocp(doc["metadata"].get("annotations"))
+                if anns:
+                    doc["metadata"]["annotations"] = anns
+                else:
+                    doc["metadata"].pop("annotations", None)
+            out_docs.append(doc)
+
+    return out_docs, _summary(dc_n, route_n, bc_n, other_n), warnings, False
 
 
 # ----------------------------
@@ -273,105 +540,90 @@ def map_output_filename(source_path, out_docs):
 # ----------------------------
 def main():
     args = parse_args()
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO,
+                        format="%(message)s")
     src = pathlib.Path(args.src_dir)
     out = pathlib.Path(args.out_dir)
     out.mkdir(parents=True, exist_ok=True)
     #print(f"source arg: {src}" )
 
     report_path = out.parent / "transform-report.md"
-    summary = {"DeploymentConfig": 0, "Route": 0, "BuildConfig": 0, "Other": 0}
-    converted = 0
+    dc_n = route_n = bc_n = other_n = 0
     warnings = []
 
-    for path in src.rglob("*"):
-        if not path.is_file() or not is_yaml_file(path):
-            continue
+    # Every output file goes straight into out (created above), so the write
+    # loop needs no per-file mkdir
+    out_str = str(out)
 
-        try:
-            docs = list(yaml.safe_load_all(path.read_text()))
-        except Exception as e:
-            warnings.append(f"Failed to parse {path}: {e}")
-            continue
+    paths = [entry.path for entry in _scan_yaml(str(src))]
+    cfg = Config.from_args(args)
 
-        out_docs = []
-        for doc in docs:
-            if not isinstance(doc, dict) or "kind" not in doc:
-                continue
+    # Files are independent, so parse/convert them in parallel. Results come
+    # back in submission order and are written here serially, which keeps the
+    # output (and the order of warnings) deterministic.
+    workers = min(os.cpu_count() or 1, len(paths))
+    if workers > 1:
+        executor = ProcessPoolExecutor(max_workers=workers)
+        results = executor.map(process_file, paths, repeat(cfg), chunksize=8)
+    else:
+        executor = None
+        results = map(process_file, paths, repeat(cfg))
 
-            kind = doc.get("kind")
-            if kind == "DeploymentConfig":
-                summary["DeploymentConfig"] += 1
-                out_docs.append(to_deployment(doc, args.image_registry, args.repo_prefix))
-                converted += 1
-
-            elif kind == "Route":
-                summary["Route"] += 1
-                out_docs.append(to_ingress(doc, args.default_domain, args.ingress_class, args.tls_secret))
-                converted += 1
-
-            elif kind == "BuildConfig":
-                summary["BuildConfig"] += 1
-                warnings.append(
-                    f"BuildConfig '{doc.get('metadata', {}).get('name', 'unnamed')}' skipped: "
-                    f"move builds to CI (e.g., GitHub Actions) and push images to "
-                    f"{args.image_registry or 'ACR'}."
-                )
-
-            else:
-                # Pass-through for k8s-native resources; remove OpenShift-only annotations
-                summary["Other"] += 1
-                if isinstance(doc.get("metadata"), dict):
-                    anns = doc["metadata"].get("annotations") or {}
-                    anns = {k: v for k, v in anns.items() if not k.startswith("openshift.io/")}
-                    if anns:
-                        doc["metadata"]["annotations"] = anns
-                    else:
-                        doc["metadata"].pop("annotations", None)
-                out_docs.append(doc)
-
-        #print(f"Output {len(out_docs)}")
-        if out_docs:
-            mapped_filename = map_output_filename(path, out_docs)
-            dest = (out / mapped_filename.name).with_suffix(".yaml")
-            print(f"doc(s) to: {dest}")
-            dest.parent.mkdir(parents=True, exist_ok=True)
-            with open(dest, "w") as g:
-                for i, d in enumerate(out_docs):
-                    yaml.safe_dump(d, g, sort_keys=False)
-                    if i < len(out_docs) - 1:
-                        g.write("---\n")
+    try:
+        for path_str, (out_docs, file_summary, file_warnings, verbatim) in zip(paths, results):
+            dc_n += file_summary["DeploymentConfig"]
+            route_n += file_summary["Route"]
+            bc_n += file_summary["BuildConfig"]
+            other_n += file_summary["Other"]
+            warnings.extend(file_warnings)
+
+            #print(f"Output {len(out_docs)}")
+            if out_docs or verbatim:
+                mapped_filename = map_output_filename(path_str, out_docs)
+                dest = os.path.join(out_str, os.path.splitext(mapped_filename)[0] + ".yaml")
+                log.debug("doc(s) to: %s", dest)
+                if verbatim:
+                    shutil.copyfile(path_str, dest)
+                    continue
+                with open(dest, "w") as g:
+                    # One emitter pass; "---" separators are written between documents
+                    yaml.dump_all(out_docs, g, Dumper=NoAliasDumper, sort_keys=False)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    summary = _summary(dc_n, route_n, bc_n, other_n)
+    converted = dc_n + route_n
 
     # Report (what happened + things to review)
-    lines = []
-    lines.append("# OpenShift → AKS Transformation Report\n")
-    lines.append(f"- Source dir: `{args.src_dir}`")
-    lines.append(f"- Output dir: `{args.out_dir}`")
-    lines.append(f"- Ingress class: `{args.ingress_class}`")
+    buf = io.StringIO()
+    buf.write("# OpenShift → AKS Transformation Report\n\n")
+    buf.write(f"- Source dir: `{args.src_dir}`\n")
+    buf.write(f"- Output dir: `{args.out_dir}`\n")
+    buf.write(f"- Ingress class: `{args.ingress_class}`\n")
     if args.tls_secret:
-        lines.append(f"- TLS secret: `{args.tls_secret}`")
+        buf.write(f"- TLS secret: `{args.tls_secret}`\n")
     if args.image_registry:
-        lines.append(f"- Image registry override: `{args.image_registry}`")
+        buf.write(f"- Image registry override: `{args.image_registry}`\n")
     if args.repo_prefix:
-        lines.append(f"- Repo prefix: `{args.repo_prefix}`")
+        buf.write(f"- Repo prefix: `{args.repo_prefix}`\n")
 
-    lines.append("\n## Summary\n")
-    lines.append(f"- DeploymentConfigs converted: **{summary['DeploymentConfig']}**")
-    lines.append(f"- Routes converted: **{summary['Route']}**")
-    lines.append(f"- BuildConfigs skipped (see notes): **{summary['BuildConfig']}**")
-    lines.append(f"- Other resources passed through: **{summary['Other']}**")
-    lines.append(f"- Total converted: **{converted}**\n")
+    buf.write("\n## Summary\n\n")
+    buf.write(f"- DeploymentConfigs converted: **{summary['DeploymentConfig']}**\n")
+    buf.write(f"- Routes converted: **{summary['Route']}**\n")
+    buf.write(f"- BuildConfigs skipped (see notes): **{summary['BuildConfig']}**\n")
+    buf.write(f"- Other resources passed through: **{summary['Other']}**\n")
+    buf.write(f"- Total converted: **{converted}**\n")
 
     if warnings:
-        lines.append("## Warnings / Notes\n")
-        for w in warnings:
-            lines.append(f"- {w}")
-        lines.append("")
+        buf.write("\n## Warnings / Notes\n\n")
+        buf.writelines("- " + w + "\n" for w in warnings)
 
     # Ensure parent directory exists
     try:
         report_path.parent.mkdir(parents=True, exist_ok=True)
         print(f"Writing report to: {report_path}")
-        report_path.write_text("\n".join(lines), encoding='utf-8')
+        report_path.write_text(buf.getvalue(), encoding='utf-8')
     except Exception as e:
         print(f"Failed to write report: {e}")
 